@@ -1,16 +1,18 @@
 import json
 import boto3
 from boto3.dynamodb.conditions import Key
+from botocore.config import Config
 
-ssm = boto3.client('ssm')
-dynamodb = boto3.resource('dynamodb')
+config = Config(tcp_keepalive=True, retries={'mode': 'standard', 'max_attempts': 3})
 
-def lambda_handler(event, context):
-   
-    dynamodb_tablename = ssm.get_parameter(Name='/petstore/dynamodbtablename', WithDecryption=False)
+ssm = boto3.client('ssm')
+dynamodb = boto3.resource('dynamodb', config=config)
 
-    table = dynamodb.Table(dynamodb_tablename['Parameter']['Value'])
+# Resolved once per container so warm invocations skip the SSM round trip
+dynamodb_tablename = ssm.get_parameter(Name='/petstore/dynamodbtablename', WithDecryption=False)
+table = dynamodb.Table(dynamodb_tablename['Parameter']['Value'])
 
+def lambda_handler(event, context):
     response = table.query(
         KeyConditionExpression=Key('petid').eq(event['petid']) & Key('pettype').eq(event['pettype'])
     )